@@ -0,0 +1,86 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Cython build of the kernel in kernels.py.
+
+Build once with ``python setup.py build_ext --inplace``; kernels.py imports
+it in preference to Numba, so the app starts without any JIT or LLVM.
+The formulas mirror kernels._kernel; tests/test_kernels.py checks that
+every built backend agrees with the NumPy path.
+"""
+from libc.math cimport pow
+
+
+cdef struct _Result:
+    double recovery
+    double ke_eff
+    double ad_eff
+    double di
+    double shock_eff
+
+
+cdef inline _Result _kernel(double gamma, double mach, double pr_th, double pt_i, double pt_e,
+                            double pt_max, double pt_min, double pt_avg, double tt_i, double tt_e,
+                            double t_i, double t_e) noexcept nogil:
+    cdef double gm1 = gamma - 1.0
+    cdef double M2 = mach * mach
+    cdef double base, temp_ratio, bracket, static_temp_ratio
+    cdef _Result r
+
+    # 1. Total Pressure Recovery (π)
+    r.recovery = pt_e / pt_i if pt_i != 0 else 0.0
+
+    # 2. Kinetic Energy Efficiency (ηKE)
+    r.ke_eff = 0.0
+    if mach > 0 and gamma > 1 and pt_e > 0:
+        base = pt_i / pt_e
+        if base > 0:
+            temp_ratio = tt_e / tt_i if tt_i != 0 else 1.0
+            bracket = (temp_ratio * pow(base, gm1 / gamma)) - 1
+            r.ke_eff = 1 - (1.0 / gm1) * (1.0 / M2) * bracket
+
+    # 3. Adiabatic Compression Efficiency (ηcomp)
+    r.ad_eff = 0.0
+    static_temp_ratio = t_e / t_i if t_i != 0 else 1.0
+    if (static_temp_ratio - 1) != 0:
+        r.ad_eff = 1 - (gm1 * M2 / 2) * (1 - r.ke_eff) / (static_temp_ratio - 1)
+
+    # 4. Distortion Index (DI)
+    r.di = (pt_max - pt_min) / pt_avg if pt_avg > 0 else 0.0
+
+    # 5. Shock Compression Efficiency (ηshock)
+    r.shock_eff = r.recovery / pr_th if pr_th > 0 else 0.0
+
+    return r
+
+
+cpdef tuple compute(double gamma, double mach, double pr_th, double pt_i, double pt_e,
+                    double pt_max, double pt_min, double pt_avg, double tt_i, double tt_e,
+                    double t_i, double t_e):
+    cdef _Result r = _kernel(gamma, mach, pr_th, pt_i, pt_e, pt_max, pt_min, pt_avg,
+                             tt_i, tt_e, t_i, t_e)
+    return r.recovery, r.ke_eff, r.ad_eff, r.di, r.shock_eff
+
+
+def compute_batch(const double[::1] gamma, const double[::1] mach, const double[::1] pr_th,
+                  const double[::1] pt_i, const double[::1] pt_e, const double[::1] pt_max,
+                  const double[::1] pt_min, const double[::1] pt_avg, const double[::1] tt_i,
+                  const double[::1] tt_e, const double[::1] t_i, const double[::1] t_e,
+                  double[::1] recovery, double[::1] ke_eff, double[::1] ad_eff,
+                  double[::1] di, double[::1] shock_eff):
+    # Batched entry point: one C loop over 12 input arrays, writing into 5
+    # preallocated outputs of the same length
+    cdef Py_ssize_t i, n = gamma.shape[0]
+    cdef _Result r
+    if not (mach.shape[0] == pr_th.shape[0] == pt_i.shape[0] == pt_e.shape[0]
+            == pt_max.shape[0] == pt_min.shape[0] == pt_avg.shape[0] == tt_i.shape[0]
+            == tt_e.shape[0] == t_i.shape[0] == t_e.shape[0] == recovery.shape[0]
+            == ke_eff.shape[0] == ad_eff.shape[0] == di.shape[0] == shock_eff.shape[0] == n):
+        raise ValueError("compute_batch arrays must all have the same length")
+    with nogil:
+        for i in range(n):
+            r = _kernel(gamma[i], mach[i], pr_th[i], pt_i[i], pt_e[i], pt_max[i], pt_min[i],
+                        pt_avg[i], tt_i[i], tt_e[i], t_i[i], t_e[i])
+            recovery[i] = r.recovery
+            ke_eff[i] = r.ke_eff
+            ad_eff[i] = r.ad_eff
+            di[i] = r.di
+            shock_eff[i] = r.shock_eff
@@ -0,0 +1,42 @@
+"""Ahead-of-time compile the kernel into the _inlet_kernel extension.
+
+Run once after installing numba::
+
+    python build_kernel.py
+
+kernels.py imports the resulting module when it is present, avoiding Numba's
+import and JIT warmup when Streamlit starts a fresh worker.
+"""
+import os
+
+from numba import njit
+from numba.pycc import CC
+
+from kernels import _kernel
+
+# pycc compiles exports with Python's error model, where x / 0.0 raises
+# ZeroDivisionError. Route the math through an IEEE ("numpy") build of the
+# kernel so the extension returns inf/NaN like the other backends.
+_ieee_kernel = njit(error_model="numpy")(getattr(_kernel, "py_func", _kernel))
+
+cc = CC("_inlet_kernel")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# 12 float64 inputs -> (recovery, ke_eff, ad_eff, di, shock_eff)
+@cc.export("compute", "UniTuple(f8, 5)(" + ", ".join(["f8"] * 12) + ")")
+def compute(gamma, mach, pr_th, pt_i, pt_e, pt_max, pt_min, pt_avg, tt_i, tt_e, t_i, t_e):
+    return _ieee_kernel(gamma, mach, pr_th, pt_i, pt_e, pt_max, pt_min, pt_avg, tt_i, tt_e, t_i, t_e)
+
+# Batched entry point, the AOT counterpart of kernels._kernel_batch: one
+# compiled loop over 12 input arrays, writing into 5 preallocated outputs
+@cc.export("compute_batch", "void(" + ", ".join(["f8[:]"] * 17) + ")")
+def compute_batch(gamma, mach, pr_th, pt_i, pt_e, pt_max, pt_min, pt_avg, tt_i, tt_e, t_i, t_e,
+                  recovery, ke_eff, ad_eff, di, shock_eff):
+    for i in range(gamma.shape[0]):
+        recovery[i], ke_eff[i], ad_eff[i], di[i], shock_eff[i] = _ieee_kernel(
+            gamma[i], mach[i], pr_th[i], pt_i[i], pt_e[i], pt_max[i], pt_min[i],
+            pt_avg[i], tt_i[i], tt_e[i], t_i[i], t_e[i]
+        )
+
+if __name__ == "__main__":
+    cc.compile()
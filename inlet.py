@@ -1,7 +1,10 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import altair as alt
 
+from kernels import INLET_DEFAULTS, NUMERIC_KEYS, calculate_parameters_batch
+
 # Page Configuration - centered layout for mobile focus
 st.set_page_config(
     page_title="ParaInlet",
@@ -14,163 +17,156 @@ st.title("ParaInlet")
 st.caption("Aerodynamic Inlet Parameter Calculator")
 
 # Initialize Session State
-if 'inlets' not in st.session_state:
-    st.session_state.inlets = []
-
-# --- Configuration ---
-with st.container():
-    st.write("### Setup")
-    num_inlets = st.number_input(
-        "Number of Inlets", 
-        min_value=1, 
-        max_value=10, 
-        value=1
-    )
-
-# State Management: Resize inlet list
-current_count = len(st.session_state.inlets)
-if current_count < num_inlets:
-    for i in range(current_count, num_inlets):
-        st.session_state.inlets.append({
-            "name": f"Inlet {i+1}",
-            "gamma": 1.4, 
-            "mach": 2.0, 
-            "pr_th": 0.98,
-            "pt_i": 101325.0, 
-            "pt_e": 95000.0,
-            "pt_max": 98000.0,
-            "pt_min": 92000.0,
-            "pt_avg": 95000.0,
-            "tt_i": 300.0, 
-            "tt_e": 350.0, 
-            "t_i": 280.0, 
-            "t_e": 330.0
-        })
-elif current_count > num_inlets:
-    st.session_state.inlets = st.session_state.inlets[:num_inlets]
-
-st.divider()
+if 'inlets_df' not in st.session_state:
+    st.session_state.inlets_df = pd.DataFrame([{"name": "Inlet 1", **INLET_DEFAULTS}])
 
-# --- Inputs (Tabs for Mobile Friendliness) ---
-if num_inlets > 0:
+# --- Inputs (single editable grid, one row per inlet) ---
+# Inside a form, edits are held client-side and sent in one round trip
+# when Calculate is pressed, instead of triggering a rerun per cell.
+with st.form("inlets_form"):
     st.write("### Parameters")
-    tabs = st.tabs([f"Inlet {i+1}" for i in range(num_inlets)])
-    for i, tab in enumerate(tabs):
-        with tab:
-            d = st.session_state.inlets[i]
-            
-            # Name
-            d["name"] = st.text_input("Name", d["name"], key=f"n{i}")
-            
+    st.caption("One row per inlet. Add or remove rows from the table toolbar.")
+    inlets_df = st.data_editor(
+        st.session_state.inlets_df,
+        num_rows="dynamic",
+        key="editor",
+        hide_index=True,
+        width="stretch",
+        column_config={
             # Flow
-            st.caption("Flow Properties")
-            c1, c2 = st.columns(2)
-            d["gamma"] = c1.number_input("Gamma (γ)", value=d["gamma"], key=f"g{i}", format="%.2f")
-            d["mach"] = c2.number_input("Mach (Mi)", value=d["mach"], key=f"m{i}", format="%.2f")
-            d["pr_th"] = st.number_input("Theor. PR (Pt,e/Pt,i)th", value=d["pr_th"], key=f"pr{i}", format="%.3f")
-            
-            # Pressure
-            st.caption("Total Pressures [Pa]")
-            d["pt_i"] = st.number_input("Inlet (Pt,i) [Pa]", value=d["pt_i"], key=f"pti{i}")
-            d["pt_e"] = st.number_input("Exit (Pt,e) [Pa]", value=d["pt_e"], key=f"pte{i}")
-            
-            st.caption("Distortion Parameters [Pa]")
-            rc1, rc2, rc3 = st.columns(3)
-            d["pt_max"] = rc1.number_input("Pt,max", value=d["pt_max"], key=f"pmax{i}")
-            d["pt_min"] = rc2.number_input("Pt,min", value=d["pt_min"], key=f"pmin{i}")
-            d["pt_avg"] = rc3.number_input("Pt,avg", value=d["pt_avg"], key=f"pavg{i}")
-            
-            # Temperature
-            st.caption("Temperatures [K]")
-            tc1, tc2 = st.columns(2)
-            d["tt_i"] = tc1.number_input("Total T In (Tt,i) [K]", value=d["tt_i"], key=f"tti{i}")
-            d["tt_e"] = tc2.number_input("Total T Out (Tt,e) [K]", value=d["tt_e"], key=f"tte{i}")
-            d["t_i"] = tc1.number_input("Static T In (Ti) [K]", value=d["t_i"], key=f"ti{i}")
-            d["t_e"] = tc2.number_input("Static T Out (Te) [K]", value=d["t_e"], key=f"te{i}")
+            "name": st.column_config.TextColumn("Name", help="Leave blank to use \"Inlet N\" for row N (or the next unused number)"),
+            "gamma": st.column_config.NumberColumn("Gamma (γ)", default=INLET_DEFAULTS["gamma"], format="%.2f", required=True),
+            "mach": st.column_config.NumberColumn("Mach (Mi)", default=INLET_DEFAULTS["mach"], format="%.2f", required=True),
+            "pr_th": st.column_config.NumberColumn("Theor. PR (Pt,e/Pt,i)th", default=INLET_DEFAULTS["pr_th"], format="%.3f", required=True),
+            # Total Pressures [Pa]
+            "pt_i": st.column_config.NumberColumn("Inlet (Pt,i) [Pa]", default=INLET_DEFAULTS["pt_i"], required=True),
+            "pt_e": st.column_config.NumberColumn("Exit (Pt,e) [Pa]", default=INLET_DEFAULTS["pt_e"], required=True),
+            # Distortion Parameters [Pa]
+            "pt_max": st.column_config.NumberColumn("Pt,max [Pa]", default=INLET_DEFAULTS["pt_max"], required=True),
+            "pt_min": st.column_config.NumberColumn("Pt,min [Pa]", default=INLET_DEFAULTS["pt_min"], required=True),
+            "pt_avg": st.column_config.NumberColumn("Pt,avg [Pa]", default=INLET_DEFAULTS["pt_avg"], required=True),
+            # Temperatures [K]
+            "tt_i": st.column_config.NumberColumn("Total T In (Tt,i) [K]", default=INLET_DEFAULTS["tt_i"], required=True),
+            "tt_e": st.column_config.NumberColumn("Total T Out (Tt,e) [K]", default=INLET_DEFAULTS["tt_e"], required=True),
+            "t_i": st.column_config.NumberColumn("Static T In (Ti) [K]", default=INLET_DEFAULTS["t_i"], required=True),
+            "t_e": st.column_config.NumberColumn("Static T Out (Te) [K]", default=INLET_DEFAULTS["t_e"], required=True),
+        },
+    )
+    submitted = st.form_submit_button("Calculate Results", type="primary", width="stretch")
+
+# New or blank-named rows are named after their position, as "Inlet N", or
+# the next free "Inlet N" when that name is already used by another row, so
+# every inlet gets its own table row label and chart bar
+blank = inlets_df["name"].isna() | (inlets_df["name"].astype(str).str.strip() == "")
+if blank.any():
+    names = inlets_df["name"].tolist()
+    taken = {name for name, is_blank in zip(names, blank) if not is_blank}
+    for i in np.flatnonzero(blank.to_numpy()):
+        n = i + 1
+        while f"Inlet {n}" in taken:
+            n += 1
+        names[i] = f"Inlet {n}"
+        taken.add(names[i])
+    inlets_df = inlets_df.assign(name=names)
 
 st.divider()
 
 # --- Calculation Logic ---
-def calculate_parameters(data):
-    # 1. Total Pressure Recovery (π)
-    recovery = data["pt_e"] / data["pt_i"] if data["pt_i"] != 0 else 0
-    
-    # 2. Kinetic Energy Efficiency (ηKE)
-    ke_eff = 0.0
-    if data["mach"] > 0 and data["gamma"] > 1 and data["pt_e"] > 0:
-        term1 = 1 / (data["gamma"] - 1)
-        term2 = 1 / (data["mach"]**2)
-        base = data["pt_i"] / data["pt_e"]
-        if base > 0:
-            exponent = (data["gamma"] - 1) / data["gamma"]
-            temp_ratio = data["tt_e"] / data["tt_i"] if data["tt_i"] != 0 else 1
-            bracket = (temp_ratio * (base**exponent)) - 1
-            ke_eff = 1 - (term1 * term2 * bracket)
-            
-    # 3. Adiabatic Compression Efficiency (ηcomp)
-    ad_eff = 0.0
-    static_temp_ratio = data["t_e"] / data["t_i"] if data["t_i"] != 0 else 1
-    if (static_temp_ratio - 1) != 0:
-        num = (data["gamma"] - 1) * (data["mach"]**2) / 2
-        term2 = (1 - ke_eff) / (static_temp_ratio - 1)
-        ad_eff = 1 - (num * term2)
-    
-    # 4. Distortion Index (DI)
-    di = 0.0
-    if data["pt_avg"] > 0:
-        di = (data["pt_max"] - data["pt_min"]) / data["pt_avg"]
-
-    # 5. Shock Compression Efficiency (ηshock)
-    shock_eff = 0.0
-    if data["pr_th"] > 0:
-        shock_eff = recovery / data["pr_th"]
-        
-    return {
-        "Name": data["name"],
+# Memoized on the inlet values: re-clicking Calculate with unchanged inputs
+# skips all math and DataFrame construction.
+@st.cache_data(ttl=None, max_entries=128)
+def calculate_parameters(inlets_df):
+    # Structure-of-Arrays: one float64 array of length N per input column
+    names = inlets_df["name"].to_numpy()
+    arrs = {k: inlets_df[k].to_numpy(dtype=np.float64) for k in NUMERIC_KEYS}
+
+    recovery, ke_eff, ad_eff, di, shock_eff = calculate_parameters_batch(arrs)
+
+    # Build the results column-wise from the kernel's freshly allocated
+    # arrays; scaling in place and copy=False hand them to pandas as-is.
+    ke_eff *= 100
+    ad_eff *= 100
+    shock_eff *= 100
+    return pd.DataFrame({
+        "Name": names,
         "Recovery": recovery,
-        "KE Eff (%)": ke_eff * 100,
-        "Adiabatic Eff (%)": ad_eff * 100,
-        "Shock Eff (%)": shock_eff * 100,
+        "KE Eff (%)": ke_eff,
+        "Adiabatic Eff (%)": ad_eff,
+        "Shock Eff (%)": shock_eff,
         "Distortion": di
-    }
+    }, copy=False)
+
+# Summary table number formats. Applied by the front-end via column_config,
+# so no Styler pass over every cell is needed on each click.
+RESULTS_COLUMN_CONFIG = {
+    "Recovery": st.column_config.NumberColumn(format="%.4f"),
+    "KE Eff (%)": st.column_config.NumberColumn(format="%.2f%%"),
+    "Adiabatic Eff (%)": st.column_config.NumberColumn(format="%.2f%%"),
+    "Shock Eff (%)": st.column_config.NumberColumn(format="%.2f%%"),
+    "Distortion": st.column_config.NumberColumn(format="%.4f")
+}
 
-def plot_colored_chart(df, x_col, y_col, title):
+# Chart panels in display order: results column -> panel title
+CHART_TITLES = {
+    "KE Eff (%)": "Kinetic Energy Efficiency (%)",
+    "Adiabatic Eff (%)": "Adiabatic Comp. Efficiency (%)",
+    "Recovery": "Pressure Recovery (π)",
+    "Distortion": "Distortion Index (DI)",
+    "Shock Eff (%)": "Shock Comp. Efficiency (%)",
+}
+
+# Name the chart spec uses to reference its long-form dataset
+CHART_DATASET = "results"
+
+# Memoized on the results: building and schema-validating the Vega-Lite
+# spec is the costly part of the chart, so identical results reuse it.
+@st.cache_data(ttl=None, max_entries=128)
+def _chart_payload(df):
+    # One long-form dataset and one spec for every metric, instead of a
+    # separate chart (and data payload) per metric.
+    long = df.melt(id_vars="Name", value_vars=list(CHART_TITLES), var_name="metric")
+    long["metric"] = long["metric"].map(CHART_TITLES)
+    # Bars don't need float64 precision; float32 halves the Arrow payload
+    long["value"] = long["value"].astype("float32")
     # Using Altair to ensure each bar (Inlet) has a different color
-    c = alt.Chart(df).mark_bar().encode(
-        x=alt.X(x_col, axis=alt.Axis(labelAngle=0)),
-        y=y_col,
-        color=alt.Color(x_col, legend=None), # This ensures distinct colors per inlet
-        tooltip=[x_col, y_col]
-    ).properties(title=title)
-    st.altair_chart(c, use_container_width=True)
+    base = alt.Chart().mark_bar().encode(
+        x=alt.X("Name:N", axis=alt.Axis(labelAngle=0), title=None),
+        y=alt.Y("value:Q", title=None),
+        color=alt.Color("Name:N", legend=None), # This ensures distinct colors per inlet
+        tooltip=["Name:N", "metric:N", "value:Q"]
+    ).properties(height=160)
+    # Stacked panels rather than a facet: the front-end stretches each simple
+    # vconcat panel to the container width, which it cannot do for a facet.
+    c = alt.vconcat(
+        *(
+            base.transform_filter(alt.FieldEqualPredicate(field="metric", equal=title))
+            .properties(title=title)
+            for title in CHART_TITLES.values()
+        ),
+        # Only a reference: to_dict() never sees the frame, so it is not
+        # inlined as JSON and Altair's row limit does not apply
+        data=alt.NamedData(name=CHART_DATASET),
+    ).resolve_scale(y="independent")
+    return long, c.to_dict()
+
+def plot_results_chart(df):
+    long, spec = _chart_payload(df)
+    # The named dataset is shipped next to the spec as Arrow
+    st.vega_lite_chart({**spec, "datasets": {CHART_DATASET: long}}, width="stretch")
 
 # --- Main Content Area ---
-if st.button("Calculate Results", type="primary", use_container_width=True):
+if submitted:
     
-    results = [calculate_parameters(inlet) for inlet in st.session_state.inlets]
-    df = pd.DataFrame(results)
+    df = calculate_parameters(inlets_df)
     
     # 1. Data Table
     st.subheader("📊 Summary")
-    st.dataframe(
-        df.style.format({
-            "Recovery": "{:.4f}",
-            "KE Eff (%)": "{:.2f}%",
-            "Adiabatic Eff (%)": "{:.2f}%",
-            "Shock Eff (%)": "{:.2f}%",
-            "Distortion": "{:.4f}"
-        }),
-        use_container_width=True
-    )
+    st.dataframe(df, column_config=RESULTS_COLUMN_CONFIG, use_container_width=True)
     
     # 2. Visualizations
     st.subheader("📈 Charts")
     
-    plot_colored_chart(df, "Name", "KE Eff (%)", "Kinetic Energy Efficiency (%)")
-    plot_colored_chart(df, "Name", "Adiabatic Eff (%)", "Adiabatic Comp. Efficiency (%)")
-    plot_colored_chart(df, "Name", "Recovery", "Pressure Recovery (π)")
-    plot_colored_chart(df, "Name", "Distortion", "Distortion Index (DI)")
-    plot_colored_chart(df, "Name", "Shock Eff (%)", "Shock Comp. Efficiency (%)")
+    plot_results_chart(df)
 
 else:
     st.info("Enter parameters and click Calculate.")
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""Calculation kernels for ParaInlet."""
+from functools import lru_cache
+from math import pow as _pow
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    # Cython-compiled kernel, built with ``python setup.py build_ext --inplace``
+    from _cy_kernel import compute_batch as _compiled_batch
+except ImportError:
+    try:
+        # Ahead-of-time compiled kernel, produced by build_kernel.py
+        from _inlet_kernel import compute_batch as _compiled_batch
+    except ImportError:
+        _compiled_batch = None
+
+if _compiled_batch is None:
+    try:
+        from numba import guvectorize, njit
+    except ImportError:  # Numba is optional; the NumPy path is used without it
+        guvectorize = njit = None
+else:
+    # A prebuilt extension needs no JIT, so skip importing Numba and its warmup
+    guvectorize = njit = None
+
+# Default values for a new inlet (read-only template)
+INLET_DEFAULTS = MappingProxyType({
+    "gamma": 1.4,
+    "mach": 2.0,
+    "pr_th": 0.98,
+    "pt_i": 101325.0,
+    "pt_e": 95000.0,
+    "pt_max": 98000.0,
+    "pt_min": 92000.0,
+    "pt_avg": 95000.0,
+    "tt_i": 300.0,
+    "tt_e": 350.0,
+    "t_i": 280.0,
+    "t_e": 330.0
+})
+
+# Ratio of specific heats for air; the default and by far the common case
+_GAMMA_AIR = 1.4
+
+NUMERIC_KEYS = (
+    "gamma", "mach", "pr_th",
+    "pt_i", "pt_e", "pt_max", "pt_min", "pt_avg",
+    "tt_i", "tt_e", "t_i", "t_e",
+)
+
+def _kernel(gamma, mach, pr_th, pt_i, pt_e, pt_max, pt_min, pt_avg, tt_i, tt_e, t_i, t_e):
+    # Scalar kernel for a single inlet; compiled with Numba when available
+    # Shared subexpressions, computed once
+    gm1 = gamma - 1.0
+    M2 = mach * mach
+
+    # 1. Total Pressure Recovery (π)
+    recovery = pt_e / pt_i if pt_i != 0 else 0.0
+
+    # 2. Kinetic Energy Efficiency (ηKE)
+    ke_eff = 0.0
+    if mach > 0 and gamma > 1 and pt_e > 0:
+        base = pt_i / pt_e
+        if base > 0:
+            exponent = gm1 / gamma
+            temp_ratio = tt_e / tt_i if tt_i != 0 else 1.0
+            bracket = (temp_ratio * _pow(base, exponent)) - 1
+            ke_eff = 1 - (1.0 / gm1) * (1.0 / M2) * bracket
+
+    # 3. Adiabatic Compression Efficiency (ηcomp)
+    ad_eff = 0.0
+    static_temp_ratio = t_e / t_i if t_i != 0 else 1.0
+    if (static_temp_ratio - 1) != 0:
+        num = gm1 * M2 / 2
+        ad_eff = 1 - num * (1 - ke_eff) / (static_temp_ratio - 1)
+
+    # 4. Distortion Index (DI)
+    di = (pt_max - pt_min) / pt_avg if pt_avg > 0 else 0.0
+
+    # 5. Shock Compression Efficiency (ηshock)
+    shock_eff = recovery / pr_th if pr_th > 0 else 0.0
+
+    return recovery, ke_eff, ad_eff, di, shock_eff
+
+if njit is not None:
+    # No nnan/ninf flags: the guards must see NaN and inf as the other
+    # backends do. IEEE division, so x / 0.0 gives inf instead of raising.
+    _kernel = njit(
+        cache=True, error_model="numpy", fastmath={"contract", "arcp", "reassoc"}
+    )(_kernel)
+
+    # Batched kernel: one compiled loop over all N inlets instead of N calls
+    # dispatched from Python. Layout is 12 input arrays -> 5 output arrays.
+    @guvectorize(
+        ["void(" + ", ".join(["float64[:]"] * 17) + ")"],
+        ",".join(["(n)"] * 12) + "->" + ",".join(["(n)"] * 5),
+        nopython=True,
+        cache=True,
+    )
+    def _kernel_batch(gamma, mach, pr_th, pt_i, pt_e, pt_max, pt_min, pt_avg, tt_i, tt_e, t_i, t_e,
+                      recovery, ke_eff, ad_eff, di, shock_eff):
+        for i in range(gamma.shape[0]):
+            recovery[i], ke_eff[i], ad_eff[i], di[i], shock_eff[i] = _kernel(
+                gamma[i], mach[i], pr_th[i], pt_i[i], pt_e[i], pt_max[i], pt_min[i],
+                pt_avg[i], tt_i[i], tt_e[i], t_i[i], t_e[i]
+            )
+
+    # Specialization for the common case of every inlet at gamma = 1.4 (air).
+    # gamma is a compile-time constant here, so gm1, the exponent and the
+    # gamma > 1 check are folded once _kernel is inlined into the loop.
+    # Built on first use rather than at import, so a worker that never
+    # sees an all-air batch does not pay for a second compile.
+    @lru_cache(maxsize=None)
+    def _kernel_batch_air():
+        @guvectorize(
+            ["void(" + ", ".join(["float64[:]"] * 16) + ")"],
+            ",".join(["(n)"] * 11) + "->" + ",".join(["(n)"] * 5),
+            nopython=True,
+            cache=True,
+        )
+        def kernel(mach, pr_th, pt_i, pt_e, pt_max, pt_min, pt_avg, tt_i, tt_e, t_i, t_e,
+                   recovery, ke_eff, ad_eff, di, shock_eff):
+            for i in range(mach.shape[0]):
+                recovery[i], ke_eff[i], ad_eff[i], di[i], shock_eff[i] = _kernel(
+                    _GAMMA_AIR, mach[i], pr_th[i], pt_i[i], pt_e[i], pt_max[i], pt_min[i],
+                    pt_avg[i], tt_i[i], tt_e[i], t_i[i], t_e[i]
+                )
+        return kernel
+
+def _kernel_numpy(arrs):
+    # Pure NumPy fallback: the same formulas as _kernel over whole arrays
+    gamma, mach, pr_th, pt_i, pt_e, pt_max, pt_min, pt_avg, tt_i, tt_e, t_i, t_e = (
+        arrs[k] for k in NUMERIC_KEYS
+    )
+    gm1 = gamma - 1.0
+    M2 = mach * mach
+
+    # Branchless: every lane is computed unconditionally with FP warnings
+    # silenced, then np.where selects the fallback value for guarded lanes.
+    with np.errstate(all="ignore"):
+        recovery = np.where(pt_i != 0, pt_e / pt_i, 0.0)
+
+        base = pt_i / pt_e
+        mask = (mach > 0) & (gamma > 1) & (pt_e > 0) & (base > 0)
+        temp_ratio = np.where(tt_i != 0, tt_e / tt_i, 1.0)
+        bracket = temp_ratio * np.power(base, gm1 / gamma) - 1
+        ke_eff = np.where(mask, 1 - (1.0 / gm1) * (1.0 / M2) * bracket, 0.0)
+
+        static_temp_ratio = np.where(t_i != 0, t_e / t_i, 1.0)
+        num = gm1 * M2 / 2
+        ad_eff = np.where(
+            static_temp_ratio - 1 != 0,
+            1 - num * (1 - ke_eff) / (static_temp_ratio - 1),
+            0.0,
+        )
+
+        di = np.where(pt_avg > 0, (pt_max - pt_min) / pt_avg, 0.0)
+
+        shock_eff = np.where(pr_th > 0, recovery / pr_th, 0.0)
+
+    return recovery, ke_eff, ad_eff, di, shock_eff
+
+def calculate_parameters_batch(arrs):
+    # Run the first available backend (Cython, AOT, Numba JIT, NumPy) over a
+    # dict of float64 arrays keyed by NUMERIC_KEYS; returns
+    # (recovery, ke_eff, ad_eff, di, shock_eff).
+    if _compiled_batch is not None:
+        # One call into the extension's compiled loop, like _kernel_batch.
+        # The Cython entry point takes C-contiguous arrays only.
+        out = np.empty((5, len(arrs["gamma"])))
+        _compiled_batch(*(np.ascontiguousarray(arrs[k]) for k in NUMERIC_KEYS), *out)
+        return tuple(out)
+    if njit is not None:
+        if np.all(arrs["gamma"] == _GAMMA_AIR):
+            return _kernel_batch_air()(*(arrs[k] for k in NUMERIC_KEYS[1:]))
+        return _kernel_batch(*(arrs[k] for k in NUMERIC_KEYS))
+    return _kernel_numpy(arrs)
@@ -0,0 +1,11 @@
+"""Build the optional Cython kernel in place::
+
+    python setup.py build_ext --inplace
+"""
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="parainlet-kernel",
+    ext_modules=cythonize("_cy_kernel.pyx"),
+)
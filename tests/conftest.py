@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the app modules (kernels, and any built extensions) importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,110 @@
+"""Every kernel backend must produce the same results on the same inputs."""
+import importlib
+import sys
+
+import numpy as np
+import pytest
+
+# The guard rows divide by zero on purpose
+pytestmark = pytest.mark.filterwarnings("ignore::RuntimeWarning")
+
+EXTENSIONS = ("_cy_kernel", "_inlet_kernel")
+
+DEFAULT = (1.4, 2.0, 0.98, 101325.0, 95000.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, 280.0, 330.0)
+INF = float("inf")
+
+# Rows in NUMERIC_KEYS order: the default inlet, then one row per guard
+ROWS = [
+    DEFAULT,
+    (1.4, 2.0, 0.98, 0.0, 95000.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, 280.0, 330.0),  # pt_i = 0
+    (1.4, 2.0, 0.98, 101325.0, 0.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, 280.0, 330.0),  # pt_e = 0
+    (1.4, 2.0, 0.98, 101325.0, 95000.0, 98000.0, 92000.0, 95000.0, 0.0, 350.0, 280.0, 330.0),  # tt_i = 0
+    (1.4, 2.0, 0.98, 101325.0, 95000.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, 0.0, 330.0),  # t_i = 0
+    (1.4, 2.0, 0.98, 101325.0, 95000.0, 98000.0, 92000.0, 0.0, 300.0, 350.0, 280.0, 330.0),  # pt_avg = 0
+    (1.4, 2.0, 0.0, 101325.0, 95000.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, 280.0, 330.0),  # pr_th = 0
+    (1.4, 2.0, 0.98, 101325.0, 95000.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, 280.0, 280.0),  # t_e = t_i
+    (1.0, 2.0, 0.98, 101325.0, 95000.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, 280.0, 330.0),  # gamma = 1
+    (0.5, 2.0, 0.98, 101325.0, 95000.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, 280.0, 330.0),  # gamma < 1
+    (1.4, 0.0, 0.98, 101325.0, 95000.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, 280.0, 330.0),  # mach = 0
+    (1.4, 1e-200, 0.98, 101325.0, 95000.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, 280.0, 330.0),  # M2 underflows
+    (1.4, 2.0, 0.98, 101325.0, 95000.0, 98000.0, 92000.0, 95000.0, 300.0, 350.0, INF, INF),  # NaN temp ratio
+    (1.4, -2.0, 0.98, -101325.0, 95000.0, 98000.0, 92000.0, -95000.0, 300.0, 350.0, 280.0, 330.0),  # negatives
+]
+
+
+# Non-reference backends; "module:batch" is the module's compute_batch loop
+BACKENDS = ["numba", "_cy_kernel", "_cy_kernel:batch", "_inlet_kernel", "_inlet_kernel:batch"]
+
+
+def _import_kernels(block_extensions):
+    # Fresh import of kernels; blocking the prebuilt extensions makes it pick
+    # the Numba JIT (or NumPy) path as it would on a machine without them
+    saved = {name: sys.modules.pop(name, None) for name in ("kernels",) + EXTENSIONS}
+    if block_extensions:
+        for name in EXTENSIONS:
+            sys.modules[name] = None
+    try:
+        return importlib.import_module("kernels")
+    finally:
+        for name in ("kernels",) + EXTENSIONS:
+            sys.modules.pop(name, None)
+            if saved[name] is not None:
+                sys.modules[name] = saved[name]
+
+
+def _loop(compute, rows):
+    return np.array([compute(*row) for row in rows]).T
+
+
+def _run(backend, rows):
+    cols = [np.array(col, dtype=np.float64) for col in zip(*rows)]
+    if backend == "numpy":
+        kernels = _import_kernels(block_extensions=True)
+        return np.array(kernels._kernel_numpy(dict(zip(kernels.NUMERIC_KEYS, cols))))
+    if backend in ("numba", "numba-air"):
+        kernels = _import_kernels(block_extensions=True)
+        if kernels.njit is None:
+            pytest.skip("numba is not installed")
+        if backend == "numba-air":
+            cols[0][:] = 1.4
+            return np.array(kernels._kernel_batch_air()(*cols[1:]))
+        return np.array(kernels._kernel_batch(*cols))
+    name, _, entry = backend.partition(":")
+    module = pytest.importorskip(name)
+    if entry == "batch":
+        out = np.empty((5, len(rows)))
+        module.compute_batch(*cols, *out)
+        return out
+    return _loop(module.compute, rows)
+
+
+def _reference(rows):
+    return _run("numpy", rows)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_matches_numpy(backend):
+    np.testing.assert_allclose(_run(backend, ROWS), _reference(ROWS), rtol=1e-12, equal_nan=True)
+
+
+def test_gamma_air_specialization_matches_numpy():
+    rows = [(1.4,) + row[1:] for row in ROWS]
+    np.testing.assert_allclose(_run("numba-air", rows), _reference(rows), rtol=1e-12, equal_nan=True)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_backend_matches_numpy_on_random_inputs(backend):
+    rng = np.random.default_rng(0)
+    choices = np.array([0.0, -1.0, 1.0, 1.4, 2.0, 300.0, 95000.0, 101325.0])
+    rows = [tuple(rng.choice(choices, 12)) for _ in range(500)]
+    rows += [tuple(rng.uniform(0.5, 1.1e5, 12)) for _ in range(500)]
+    np.testing.assert_allclose(_run(backend, rows), _reference(rows), rtol=1e-9, equal_nan=True)
+
+
+def test_default_inlet():
+    recovery, ke_eff, ad_eff, di, shock_eff = _reference([DEFAULT])[:, 0]
+    assert recovery == pytest.approx(0.937577103)
+    assert ke_eff == pytest.approx(0.882280530)
+    assert ad_eff == pytest.approx(0.472616773)
+    assert di == pytest.approx(0.063157895)
+    assert shock_eff == pytest.approx(0.956711330)